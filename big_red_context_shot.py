@@ -16,85 +16,193 @@ Tech:
 
 Output file: ~/Documents/ContextShots.docx (auto-rotates after 90 rows)
 """
+import io
 import os
 import time
+import uuid
+import base64
+import zipfile
+import tempfile
 import shlex
+import queue
+import shutil
+import functools
+import atexit
 import platform
 import subprocess
 import threading
-from datetime import datetime
+import concurrent.futures
+from contextlib import contextmanager
 from pathlib import Path
 import webbrowser
 
-from flask import Flask, request, render_template_string, redirect, url_for, flash
+from flask import Flask, request, redirect, url_for, flash, jsonify
 
 # Word
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.opc import phys_pkg
+from lxml import etree
 
 # Screenshot (Windows/Linux desktop)
 from mss import mss
-from mss.tools import to_png
+from PIL import Image
 
 # Website screenshots (headless Chrome)
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchWindowException, TimeoutException, WebDriverException,
+)
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Optional: lets the poller recycle Chrome when its memory grows too large
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Optional: threaded production WSGI server (falls back to Flask's dev server)
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
 APP_TITLE = "Big Red Button - Context + Screenshot (Cross-Platform)"
 HOST = "127.0.0.1"
 PORT = 8788
 MAX_ROWS_PER_DOC = 90
 DEFAULT_DOC_NAME = "ContextShots.docx"
 DEFAULT_DELAY_SECONDS = 2.0
+DEFAULT_MONITOR_INDEX = 1     # MSS numbering: 0 = all monitors (virtual desktop), 1 = primary, 2.. = others
+# Headless browser profiles: "eager" returns at DOMContentLoaded instead of waiting for every image/script
+BROWSER_PROFILES = {
+    "eager": {"label": "Fast (DOM ready)", "page_load_strategy": "eager", "images": True},
+    "normal": {"label": "Full load (wait for images/scripts)", "page_load_strategy": "normal", "images": True},
+    "text": {"label": "Text only (no images)", "page_load_strategy": "eager", "images": False},
+}
+DEFAULT_BROWSER_PROFILE = "eager"
+MAX_TRACKED_JOBS = 50         # finished manual-capture jobs remembered for /job/<id>
+DRIVER_POOL_SIZE = 2          # headless Chrome instances kept warm for one-off captures
+DRIVER_MAX_USES = 50          # recycle a pooled driver after this many captures
+SHRINK_IMAGES_FOR_DOC = True  # downscale screenshots to column size before embedding (False = full-res)
+DOC_COLUMN_WIDTH_INCHES = 3.1  # each of the two table columns
+DOC_IMAGE_DPI = 300           # embedded screenshots are sized for this print density in the column
+DOC_IMAGE_MAX_SIZE = (int(DOC_COLUMN_WIDTH_INCHES * DOC_IMAGE_DPI), 6000)  # px bounding box (~930 wide)
+DESKTOP_IMAGE_FORMAT = "JPEG"  # desktop grabs: "JPEG" (fast libjpeg-turbo encode) or "PNG" (lossless)
+JPEG_QUALITY = 85
+BATCH_MAX_ENTRIES = 10        # poller captures buffered before one combined doc save
+BATCH_MAX_AGE_SECONDS = 30.0  # ...or flushed this long after the first buffered capture
+POLLER_BATCH_MAX_AGE_SECONDS = 600.0  # poller: batch age scales with the interval, up to this cap
+MANUAL_BATCH_MAX_ENTRIES = 5  # manual captures: save once this many are pending
+MANUAL_BATCH_DELAY_SECONDS = 2.0  # ...or this long after the latest one (a burst of clicks = one save)
+POLLER_RECYCLE_EVERY = 200    # poller restarts its browser after this many captures
+POLLER_MAX_DRIVER_RSS = int(1.5 * 1024 ** 3)  # ...or once chromedriver + Chrome exceed this (needs psutil)
 
 app = Flask(__name__)
 app.secret_key = "context-shot-cross"
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 86400  # let the browser cache static/app.css + app.js
 
 # Synchronize Word writes across threads
 _doc_lock = threading.Lock()
 
+# Data-row count per doc path as (st_mtime_ns, rows); a changed mtime means "re-count". Guarded by _doc_lock
+_doc_row_cache = {}
+# Log base path -> number of its newest "(n)" rollover part (1 = the base file itself)
+_doc_parts = {}
+
+# The last doc we saved, kept parsed as (path, st_mtime_ns, Document) so the next append skips the load
+_last_saved_doc = None
+
+# Captures waiting for a combined save: (doc_path, ts, context, screenshot, Future); guarded by _doc_lock.
+# Each Future resolves to the saved doc path (or the save error) once its row is written.
+_pending_batch = []
+_batch_timer = None
+_batch_started = 0.0   # time.monotonic() of the oldest pending capture
+_batch_deadline = 0.0  # when _batch_timer fires
+_last_batch_error = ""  # last timer/exit flush failure; cleared by the next successful save
+
+# Per-thread MSS handle (keeps the display connection open between captures)
+_mss_tls = threading.local()
+_monitor_list = None  # sct.monitors, looked up once per process
+
+# Manual desktop captures run here (one at a time) so /capture returns immediately
+_capture_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
+_warm_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="doc-warm")
+_jobs = {}  # job id -> (Future, delay); insertion-ordered so the oldest are pruned first
+_jobs_lock = threading.Lock()
+
 # Poller state
 _poller_thread = None
 _poller_stop = threading.Event()
-_poller_status = {"running": False, "url": "", "interval": 0.0}
+_poller_status = {"running": False, "url": "", "interval": 0.0, "profile": DEFAULT_BROWSER_PROFILE}
 
 
 # ----------------- Helpers -----------------
 
+@functools.lru_cache(maxsize=1)
 def user_documents_dir() -> Path:
     home = Path.home()
     docs = home / "Documents"
     return docs if docs.exists() else home
 
-def next_available_filename(base: Path) -> Path:
+def _timestamp(t: float = None) -> str:
+    """Local "YYYY-mm-dd HH:MM:SS" for epoch seconds `t` (default: now), via C strftime."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+
+def _part_name(base: Path, n: int) -> Path:
+    return base if n < 2 else base.with_name(f"{base.stem} ({n}){base.suffix}")
+
+def latest_document_part(base: Path) -> Path:
+    """Newest rollover file of `base` (`base` itself until it has rolled over).
+
+    The part number is remembered, so normally this costs one stat; the "(2), (3), ..."
+    candidates are only probed again if that part disappears.
+    """
+    n = _doc_parts.get(str(base))
+    if n is None or not _part_name(base, n).exists():
+        if not base.exists():
+            _doc_parts.pop(str(base), None)
+            return base
+        n = 1
+        while _part_name(base, n + 1).exists():
+            n += 1
+        _doc_parts[str(base)] = n
+    return _part_name(base, n)
+
+def _next_part_number(base: Path) -> int:
+    """Part number for the next new log file (1 = `base` itself, when it doesn't exist)."""
     if not base.exists():
-        return base
-    stem, suffix = base.stem, base.suffix
-    n = 2
-    while True:
-        cand = base.with_name(f"{stem} ({n}){suffix}")
-        if not cand.exists():
-            return cand
+        return 1
+    latest_document_part(base)  # refreshes _doc_parts
+    n = _doc_parts[str(base)] + 1
+    while _part_name(base, n).exists():  # parts created behind our back (e.g. another instance)
         n += 1
+    return n
+
+def next_available_filename(base: Path) -> Path:
+    return _part_name(base, _next_part_number(base))
 
 def _set_table_column_widths(table, widths_in_inches):
-    for idx, width in enumerate(widths_in_inches):
-        for cell in table.columns[idx].cells:
-            tc = cell._tc
-            tcPr = tc.get_or_add_tcPr()
-            tcW = OxmlElement('w:tcW')
-            tcW.set(qn('w:type'), 'dxa')
-            tcW.set(qn('w:w'), str(int(width * 1440)))  # 1 in = 1440 twips
-            tcPr.append(tcW)
+    """Set widths on the table grid (w:gridCol); rows added later copy their cell widths from it."""
+    widths = [Inches(w) for w in widths_in_inches]
+    for grid_col, width in zip(table._tbl.tblGrid.gridCol_lst, widths):
+        grid_col.w = width
+    # Cells that already exist (just the header row at creation time) carry their own w:tcW
+    for row in table.rows:
+        for cell, width in zip(row.cells, widths):
+            cell.width = width
+
+def _log_title(title_suffix: str = "") -> str:
+    return f"Context + Screenshot Log {title_suffix}".strip()
 
 def _add_title_and_table(doc: Document, title_suffix: str = ""):
     title = doc.add_paragraph()
-    run = title.add_run(f"Context + Screenshot Log {title_suffix}".strip())
+    run = title.add_run(_log_title(title_suffix))
     run.font.size = Pt(16)
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
@@ -102,177 +210,833 @@ def _add_title_and_table(doc: Document, title_suffix: str = ""):
     hdr = table.rows[0].cells
     hdr[0].text = "Context (with timestamp)"
     hdr[1].text = "Screenshot"
-    _set_table_column_widths(table, [3.1, 3.1])
+    _set_table_column_widths(table, [DOC_COLUMN_WIDTH_INCHES, DOC_COLUMN_WIDTH_INCHES])
+    return table
+
+@functools.lru_cache(maxsize=1)
+def _empty_log_doc_bytes() -> bytes:
+    """A saved blank log (title + header table), built once so new/rotated docs skip the default template."""
+    doc = Document()
+    _add_title_and_table(doc)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+def _new_log_document(title_suffix: str = ""):
+    """Fresh log doc from the cached blank; returns (doc, table)."""
+    doc = Document(io.BytesIO(_empty_log_doc_bytes()))
+    if title_suffix:
+        for para in doc.paragraphs:
+            if para.runs and para.runs[0].text == _log_title():
+                para.runs[0].text = _log_title(title_suffix)
+                break
+    return doc, doc.tables[0]
+
+def _cached_row_count(doc_path: Path):
+    """Row count remembered for `doc_path`, or None if unknown or the file changed since."""
+    hit = _doc_row_cache.get(str(doc_path))
+    if hit is None:
+        return None
+    try:
+        mtime_ns = doc_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return hit[1] if hit[0] == mtime_ns else None
+
+_W_TR = qn("w:tr")
+
+def _row_count_fast(doc_path: Path, cap: int = MAX_ROWS_PER_DOC) -> int:
+    """Data rows in the log table, streamed from word/document.xml without building the docx model.
+
+    Stops counting once `cap` is reached, since callers only need to know "is it full?".
+    """
+    count = 0
+    with zipfile.ZipFile(doc_path) as z, z.open("word/document.xml") as f:
+        for _, el in etree.iterparse(f, events=("end",), tag=_W_TR):
+            count += 1
+            el.clear()
+            if count - 1 >= cap:  # first row is the header
+                break
+    return max(0, count - 1)
+
+def _remember_row_count(doc_path: Path, rows: int):
+    try:
+        _doc_row_cache[str(doc_path)] = (doc_path.stat().st_mtime_ns, rows)
+    except OSError:
+        _doc_row_cache.pop(str(doc_path), None)
 
-def ensure_document_and_table(doc_path: Path):
+def _cached_document(doc_path: Path):
+    """The in-memory Document for `doc_path` if it's the one we last saved and the file is unchanged."""
+    if _last_saved_doc is None or _last_saved_doc[0] != str(doc_path):
+        return None
+    try:
+        mtime_ns = doc_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _last_saved_doc[2] if _last_saved_doc[1] == mtime_ns else None
+
+def _remember_document(doc_path: Path, doc):
+    global _last_saved_doc
+    try:
+        _last_saved_doc = (str(doc_path), doc_path.stat().st_mtime_ns, doc)
+    except OSError:
+        _last_saved_doc = None
+
+def _forget_document():
+    global _last_saved_doc
+    _last_saved_doc = None
+
+def _rotated_document(base: Path):
+    n = _next_part_number(base)
+    _doc_parts[str(base)] = n
+    # n == 1: the base file was moved away, so the log starts over under its own name
+    doc, table = _new_log_document(title_suffix=f"(Part {n})" if n > 1 else "")
+    return doc, table, _part_name(base, n), 0
+
+def ensure_document_and_table(base: Path):
+    """Open (or create/rotate) the log doc. Returns (doc, table, path, existing_rows).
+
+    Rows go to the newest rollover part of `base`; a new part starts once that one is full.
+    """
+    doc_path = latest_document_part(base)
     if doc_path.exists():
-        doc = Document(str(doc_path))
-        if doc.tables:
-            table = doc.tables[0]
+        # A full doc rotates without loading it: use the remembered count, else a streamed row count
+        known_rows = _cached_row_count(doc_path)
+        if known_rows is None:
+            try:
+                known_rows = _row_count_fast(doc_path)
+                _remember_row_count(doc_path, known_rows)
+            except Exception:
+                known_rows = None  # let python-docx open it (and report any real problem)
+        if known_rows is not None and known_rows >= MAX_ROWS_PER_DOC:
+            return _rotated_document(base)
+        doc = _cached_document(doc_path)
+        if doc is None:
+            doc = Document(str(doc_path))
+        tables = doc.tables  # an XPath walk over the body each time it's read
+        if tables:
+            table = tables[0]
             if len(table.columns) != 2:
-                doc = Document()
-                _add_title_and_table(doc)
-                return doc, doc.tables[0], doc_path
+                doc, table = _new_log_document()
+                return doc, table, doc_path, 0
             rows = max(0, len(table.rows) - 1)
+            _remember_row_count(doc_path, rows)
             if rows >= MAX_ROWS_PER_DOC:
-                new_path = next_available_filename(doc_path)
-                doc = Document()
-                _add_title_and_table(doc, title_suffix=f"(Part {new_path.stem.split()[-1].strip('()')})")
-                return doc, doc.tables[0], new_path
-            return doc, table, doc_path
+                return _rotated_document(base)
+            return doc, table, doc_path, rows
         else:
-            _add_title_and_table(doc)
-            return doc, doc.tables[0], doc_path
+            return doc, _add_title_and_table(doc), doc_path, 0
     else:
-        doc = Document()
-        _add_title_and_table(doc)
-        return doc, doc.tables[0], doc_path
+        doc, table = _new_log_document()
+        return doc, table, doc_path, 0
 
-def compute_column_image_width_inches(doc: Document) -> float:
-    section = doc.sections[0]
-    page_width = section.page_width / 914400
-    left = section.left_margin / 914400
-    right = section.right_margin / 914400
+def _warm_document(base: Path):
+    """Parse the current log part into the in-memory doc cache ahead of a write (runs during the capture delay)."""
+    with _doc_lock:
+        doc_path = latest_document_part(base)
+        if not doc_path.exists() or _cached_document(doc_path) is not None:
+            return
+        rows = _cached_row_count(doc_path)
+        if rows is None:
+            try:
+                rows = _row_count_fast(doc_path)
+                _remember_row_count(doc_path, rows)
+            except Exception:
+                rows = None  # the write opens it and reports the problem
+        if rows is not None and rows >= MAX_ROWS_PER_DOC:
+            return  # the next write rotates without opening it
+        doc = Document(str(doc_path))
+        tables = doc.tables
+        if tables and len(tables[0].columns) == 2:
+            _remember_row_count(doc_path, max(0, len(tables[0].rows) - 1))
+        compute_column_image_width_inches(doc)
+        _remember_document(doc_path, doc)
+
+@functools.lru_cache(maxsize=8)
+def _column_image_width_inches(page_width_emu: int, left_emu: int, right_emu: int) -> float:
+    page_width = page_width_emu / 914400
+    left = left_emu / 914400
+    right = right_emu / 914400
     usable = page_width - left - right
     return max(2.2, min((usable / 2.0) - 0.15, 3.5))
 
-def take_full_screenshot_to(file_path: Path) -> None:
-    """Desktop full virtual screen capture (macOS via screencapture; others via MSS)."""
+def compute_column_image_width_inches(doc: Document) -> float:
+    """Picture width for the log column; worked out once per Document object."""
+    width = getattr(doc, "_cached_col_width", None)
+    if width is None:
+        section = doc.sections[0]
+        width = _column_image_width_inches(section.page_width, section.left_margin, section.right_margin)
+        try:
+            doc._cached_col_width = width
+        except AttributeError:
+            pass  # python-docx versions with a __slots__ Document proxy
+    return width
+
+def _mss_handle():
+    sct = getattr(_mss_tls, "sct", None)
+    if sct is None:
+        sct = _mss_tls.sct = mss()
+    return sct
+
+def desktop_monitors() -> list:
+    """MSS monitor geometry: [virtual desktop, monitor 1, monitor 2, ...] ([] if unavailable)."""
+    global _monitor_list
+    if _monitor_list is None:
+        try:
+            _monitor_list = list(_mss_handle().monitors)
+        except Exception:
+            return []
+    return _monitor_list
+
+def _valid_monitor_index(monitor_index: int) -> int:
+    count = len(desktop_monitors())
+    if count == 0 or 0 <= monitor_index < count:
+        return monitor_index
+    return 1 if count > 1 else 0
+
+def grab_desktop_image(monitor_index: int = DEFAULT_MONITOR_INDEX):
+    """Desktop capture as a PIL image (macOS via screencapture; others via MSS).
+
+    `monitor_index` follows MSS numbering: 0 is the whole virtual desktop, 1 the primary
+    monitor. One monitor is usually what you want and is a fraction of the pixels.
+    """
     system = platform.system().lower()
     if system == "darwin":
-        cmd = f'screencapture -x -t png {shlex.quote(str(file_path))}'
+        # screencapture only writes files; read it back and clean up
+        fd, tmp = tempfile.mkstemp(suffix=".png")
+        os.close(fd)
+        tmp_png = Path(tmp)
+        try:
+            take_full_screenshot_to(tmp_png, monitor_index=monitor_index)
+            return Image.open(io.BytesIO(tmp_png.read_bytes()))
+        finally:
+            _discard_temp(tmp_png)
+    sct = _mss_handle()
+    monitors = desktop_monitors() or sct.monitors
+    raw = sct.grab(monitors[_valid_monitor_index(monitor_index)])
+    # Pillow's C decoder reads MSS's BGRA buffer directly and does the BGRA -> RGB swap while
+    # building the image (one copy); raw.rgb / raw.bgra would add another full-screen copy first
+    return Image.frombuffer("RGB", raw.size, raw.raw, "raw", "BGRX", 0, 1)
+
+def take_full_screenshot_to(file_path: Path = None, monitor_index: int = 0):
+    """Desktop capture (whole virtual desktop unless `monitor_index` says otherwise).
+
+    Writes a PNG to `file_path`, or returns the PNG bytes when no path is given.
+    """
+    if file_path is not None and platform.system().lower() == "darwin":
+        display = f"-D {int(monitor_index)} " if monitor_index >= 1 else ""
+        cmd = f'screencapture -x {display}-t png {shlex.quote(str(file_path))}'
         subprocess.run(cmd, shell=True, check=True)
+        return None
+    png = _encode_png(grab_desktop_image(monitor_index))
+    if file_path is None:
+        return png
+    Path(file_path).write_bytes(png)
+    return None
+
+def _discard_temp(path: Path):
+    try:
+        if path.exists():
+            path.unlink()
+    except Exception:
+        pass
+
+def _encode_png(img) -> bytes:
+    """PNG-encode a PIL image at zlib level 1 (optimize=True is ~10x slower and rarely smaller)."""
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+def _encode_desktop_image(img) -> bytes:
+    """Encode a desktop grab as DESKTOP_IMAGE_FORMAT."""
+    if DESKTOP_IMAGE_FORMAT.upper() in ("JPEG", "JPG"):
+        buf = io.BytesIO()
+        (img if img.mode == "RGB" else img.convert("RGB")).save(buf, format="JPEG", quality=JPEG_QUALITY)
+        return buf.getvalue()
+    return _encode_png(img)
+
+def _shrink_image(img) -> bytes:
+    """Downscale a PIL image in place to DOC_IMAGE_MAX_SIZE and return it as PNG bytes."""
+    img.thumbnail(DOC_IMAGE_MAX_SIZE, Image.BILINEAR)
+    return _encode_png(img)
+
+def _shrink_for_doc(png_bytes: bytes) -> bytes:
+    """Downscale a PNG to DOC_IMAGE_MAX_SIZE so the docx (and every later save) stays small."""
+    with Image.open(io.BytesIO(png_bytes)) as img:
+        if img.width <= DOC_IMAGE_MAX_SIZE[0] and img.height <= DOC_IMAGE_MAX_SIZE[1]:
+            return png_bytes
+        return _shrink_image(img)
+
+def _prepare_screenshot(screenshot):
+    """Turn a PIL image, PNG bytes or PNG path into what gets embedded, applying SHRINK_IMAGES_FOR_DOC.
+
+    PIL images (desktop grabs) are encoded here, once, as DESKTOP_IMAGE_FORMAT;
+    paths come back as bytes when shrinking.
+    """
+    if isinstance(screenshot, Image.Image):
+        if SHRINK_IMAGES_FOR_DOC:
+            screenshot.thumbnail(DOC_IMAGE_MAX_SIZE, Image.BILINEAR)
+        return _encode_desktop_image(screenshot)
+    if not SHRINK_IMAGES_FOR_DOC:
+        return screenshot
+    if not isinstance(screenshot, (bytes, bytearray)):
+        screenshot = Path(screenshot).read_bytes()
+    return _shrink_for_doc(screenshot)
+
+def _picture_source(screenshot):
+    """add_picture() input for encoded image bytes (kept in memory) or a path on disk."""
+    if isinstance(screenshot, (bytes, bytearray)):
+        return io.BytesIO(screenshot)
+    return str(screenshot)
+
+_STORED_MEDIA_EXTS = {"png", "jpg", "jpeg", "gif"}
+
+def _store_media_uncompressed():
+    """Make python-docx store already-compressed images as-is instead of deflating them again.
+
+    Only media parts are affected; the XML parts keep ZIP_DEFLATED.
+    """
+    writer = getattr(phys_pkg, "_ZipPkgWriter", None)
+    if writer is None or getattr(writer, "_stores_media", False):
         return
-    with mss() as sct:
-        monitor = sct.monitors[0]  # virtual screen (all monitors)
-        raw = sct.grab(monitor)
-        to_png(raw.rgb, raw.size, output=str(file_path))
-
-def append_entry(doc_path: Path, context_text: str, screenshot_path: Path) -> Path:
-    target = doc_path
-    if target.exists():
-        doc_tmp = Document(str(target))
-        table_tmp = doc_tmp.tables[0] if doc_tmp.tables else None
-        rows_tmp = (len(table_tmp.rows) - 1) if table_tmp else 0
-        if rows_tmp >= MAX_ROWS_PER_DOC:
-            target = next_available_filename(target)
-
-    # Lock while writing the Word doc to avoid races with the poller
-    with _doc_lock:
-        doc, table, target = ensure_document_and_table(target)
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        row = table.add_row()
-        row.cells[0].text = f"{ts} — {context_text.strip() if context_text else '(no context provided)'}"
-        p = row.cells[1].paragraphs[0]
-        run = p.add_run()
+    deflate_write = writer.write
+
+    def write(self, pack_uri, blob):
+        if pack_uri.ext.lower() in _STORED_MEDIA_EXTS:
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            deflate_write(self, pack_uri, blob)
+
+    writer.write = write
+    writer._stores_media = True
+
+_store_media_uncompressed()
+
+def _save_document(doc, target: Path):
+    """Save a doc with one large write, into a temp file that then replaces `target`.
+
+    Readers never see a half-written log, and a failed save leaves the previous file intact.
+    """
+    buf = io.BytesIO()
+    doc.save(buf)
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(buf.getbuffer())
+        os.replace(tmp, target)
+    except Exception:
+        _discard_temp(tmp)
+        raise
+
+def _write_entries(doc_path: Path, entries, saved: list = None) -> list:
+    """Append (ts, context, screenshot) rows, saving once per doc touched. Caller holds _doc_lock.
+
+    Returns the path each entry was saved to (a batch can span a rollover). `saved`, if
+    given, is filled as each doc is saved, so it still shows what landed if a later save fails.
+    """
+    saved = [] if saved is None else saved
+    remaining = list(entries)
+    while remaining:
+        doc, table, target, rows = ensure_document_and_table(doc_path)
+        room = max(1, MAX_ROWS_PER_DOC - rows)
+        chunk, remaining = remaining[:room], remaining[room:]
         width = compute_column_image_width_inches(doc)
-        run.add_picture(str(screenshot_path), width=Inches(width))
-        doc.save(str(target))
+        try:
+            for ts, context_text, screenshot in chunk:
+                row = table.add_row()
+                row.cells[0].text = f"{ts} — {context_text.strip() if context_text else '(no context provided)'}"
+                p = row.cells[1].paragraphs[0]
+                run = p.add_run()
+                run.add_picture(_picture_source(screenshot), width=Inches(width))
+            _save_document(doc, target)
+        except Exception:
+            _forget_document()  # the in-memory doc may now hold rows that never reached the file
+            raise
+        _remember_row_count(target, rows + len(chunk))
+        _remember_document(target, doc)
+        saved.extend([target] * len(chunk))
+    return saved
+
+def _flush_batch_locked():
+    """Write all pending captures. Caller holds _doc_lock. Returns the last saved path (or None).
+
+    Entries leave the queue before writing; a failed write is reported through their
+    Futures (and re-raised) rather than retried.
+    """
+    global _batch_timer, _last_batch_error
+    if _batch_timer is not None:
+        _batch_timer.cancel()
+        _batch_timer = None
+    target = None
+    while _pending_batch:
+        doc_path = _pending_batch[0][0]
+        n = 1
+        while n < len(_pending_batch) and _pending_batch[n][0] == doc_path:
+            n += 1
+        group = _pending_batch[:n]
+        del _pending_batch[:n]
+        saved = []
+        try:
+            _write_entries(doc_path, [entry[1:4] for entry in group], saved)
+        except Exception as e:
+            for entry in group[len(saved):]:
+                entry[4].set_exception(e)
+            raise
+        finally:
+            for entry, path in zip(group, saved):
+                entry[4].set_result(path)
+                # Temp PNGs are only removed once their rows are safely saved
+                if isinstance(entry[3], Path):
+                    _discard_temp(entry[3])
+        target = saved[-1]
+        _last_batch_error = ""
     return target
 
+def flush_batch():
+    with _doc_lock:
+        return _flush_batch_locked()
+
+def _flush_batch_quietly():
+    """Timer/atexit flush; failures reach the rows' Futures and stay in _last_batch_error."""
+    global _last_batch_error
+    try:
+        flush_batch()
+    except Exception as e:
+        _last_batch_error = f"Batched save failed: {e}"
+
+atexit.register(_flush_batch_quietly)
+
+def _schedule_flush_locked(deadline: float):
+    global _batch_timer, _batch_deadline
+    if _batch_timer is not None:
+        _batch_timer.cancel()
+    _batch_deadline = deadline
+    _batch_timer = threading.Timer(max(0.0, deadline - time.monotonic()), _flush_batch_quietly)
+    _batch_timer.daemon = True
+    _batch_timer.start()
+
+def append_entry_batched(doc_path: Path, context_text: str, screenshot, manual: bool = False,
+                         max_age: float = BATCH_MAX_AGE_SECONDS):
+    """Queue an entry for a combined save and return a Future for its saved doc path.
+
+    `screenshot` is a PIL image, PNG bytes or a temp PNG path (the path is deleted once saved).
+    Poller entries flush at BATCH_MAX_ENTRIES or `max_age` seconds after the first one;
+    manual entries flush at MANUAL_BATCH_MAX_ENTRIES or MANUAL_BATCH_DELAY_SECONDS after the
+    latest click (never later than `max_age` overall).
+    """
+    global _batch_started
+    ts = _timestamp()
+    prepared = _prepare_screenshot(screenshot)
+    if prepared is not screenshot and isinstance(screenshot, Path):
+        _discard_temp(screenshot)
+    future = concurrent.futures.Future()
+    now = time.monotonic()
+    with _doc_lock:
+        if not _pending_batch:
+            _batch_started = now
+        _pending_batch.append((doc_path, ts, context_text, prepared, future))
+        max_entries = MANUAL_BATCH_MAX_ENTRIES if manual else BATCH_MAX_ENTRIES
+        if len(_pending_batch) >= max_entries:
+            try:
+                _flush_batch_locked()
+            except Exception:
+                pass  # already reported through the entries' Futures
+            return future
+        if manual:
+            # Debounce: push the save back with every click, bounded by the overall max age
+            deadline = min(now + MANUAL_BATCH_DELAY_SECONDS, _batch_started + max_age)
+        else:
+            deadline = now + max_age
+            if _batch_timer is not None:
+                deadline = min(deadline, _batch_deadline)
+        if _batch_timer is None or deadline != _batch_deadline:
+            _schedule_flush_locked(deadline)
+    return future
+
+def append_entry(doc_path: Path, context_text: str, screenshot) -> Path:
+    """Append one entry (PIL image, PNG bytes or a PNG path) and save right away.
+
+    Pending poller captures are written first so rows stay in capture order.
+    """
+    ts = _timestamp()
+    screenshot = _prepare_screenshot(screenshot)
+    # Lock while writing the Word doc to avoid races with the poller.
+    # ensure_document_and_table handles rotation, so the doc is parsed only once.
+    with _doc_lock:
+        try:
+            _flush_batch_locked()
+        except Exception:
+            pass  # already reported through the batched entries' Futures
+        return _write_entries(doc_path, [(ts, context_text, screenshot)])[-1]
+
 # ----------------- Website Screenshot (Selenium) -----------------
 
-def _create_headless_driver():
-    """Create a headless Chrome driver (robust across Chrome versions)."""
+_chromedriver_path = None
+_chromedriver_on_path = False  # True while using the PATH binary (which may not match the installed Chrome)
+
+def _chromedriver_service(managed: bool = False):
+    """ChromeService for chromedriver, resolved once per process.
+
+    A chromedriver on PATH wins; otherwise webdriver-manager downloads/locates one.
+    `managed=True` switches from the PATH binary to webdriver-manager's (for a stale PATH driver).
+    """
+    global _chromedriver_path, _chromedriver_on_path
+    if managed and _chromedriver_on_path:
+        _chromedriver_path = ChromeDriverManager().install()
+        _chromedriver_on_path = False
+    if _chromedriver_path is None:
+        found = shutil.which("chromedriver")
+        _chromedriver_on_path = found is not None
+        _chromedriver_path = found or ChromeDriverManager().install()
+    return ChromeService(_chromedriver_path)
+
+def _create_headless_driver(profile: str = DEFAULT_BROWSER_PROFILE):
+    """Create a headless Chrome driver for a BROWSER_PROFILES entry (robust across Chrome versions)."""
+    settings = BROWSER_PROFILES.get(profile) or BROWSER_PROFILES[DEFAULT_BROWSER_PROFILE]
+    images = "true" if settings["images"] else "false"
     last_err = None
-    for headless_flag in ("--headless=new", "--headless"):
-        try:
-            options = ChromeOptions()
-            options.add_argument(headless_flag)
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("--hide-scrollbars")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--blink-settings=imagesEnabled=true")
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119 Safari/537.36')
-            service = ChromeService(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
-            driver.set_page_load_timeout(60)
-            return driver
-        except Exception as e:
-            last_err = e
-            continue
+    # Second pass only if a PATH chromedriver failed: retry with webdriver-manager's matching one
+    for managed in (False, True):
+        for headless_flag in ("--headless=new", "--headless"):
+            try:
+                options = ChromeOptions()
+                options.page_load_strategy = settings["page_load_strategy"]
+                options.add_argument(headless_flag)
+                options.add_argument("--disable-gpu")
+                options.add_argument("--no-sandbox")
+                options.add_argument("--window-size=1920,1080")
+                options.add_argument("--hide-scrollbars")
+                options.add_argument("--disable-extensions")
+                options.add_argument("--disable-dev-shm-usage")
+                options.add_argument(f"--blink-settings=imagesEnabled={images}")
+                options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119 Safari/537.36')
+                service = _chromedriver_service(managed=managed)
+                driver = webdriver.Chrome(service=service, options=options)
+                driver.set_page_load_timeout(60)
+                driver.set_script_timeout(3)
+                return driver
+            except Exception as e:
+                last_err = e
+                continue
+        if not _chromedriver_on_path:
+            break
     raise RuntimeError(f"Failed to create headless Chrome driver: {last_err}")
 
-def screenshot_website(url: str, out_path: Path, driver=None, full_page=True):
-    """Take a screenshot of a website using a headless browser."""
-    local_driver = driver or _create_headless_driver()
-    own_driver = driver is None
+def _quit_driver(driver):
     try:
-        local_driver.get(url)
-        # Wait a bit for dynamic content; try a trivial JS readyState wait
+        driver.quit()
+    except Exception:
+        pass
+
+class _WebDriverPool:
+    """Keeps a few headless Chrome drivers (of one profile) warm so one-off captures skip browser startup."""
+
+    def __init__(self, profile: str = DEFAULT_BROWSER_PROFILE, size: int = DRIVER_POOL_SIZE,
+                 max_uses: int = DRIVER_MAX_USES):
+        self._profile = profile
+        self._size = size
+        self._max_uses = max_uses
+        self._idle = queue.Queue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._uses = {}
+
+    @contextmanager
+    def acquire(self, timeout: float = 120.0):
+        driver = self._checkout(timeout)
         try:
-            for _ in range(50):
-                rs = local_driver.execute_script("return document.readyState")
-                if rs == "complete":
-                    break
-                time.sleep(0.1)
-        except Exception:
-            time.sleep(1.0)
-        time.sleep(0.5)  # small settle
+            yield driver
+        finally:
+            self.release(driver)
 
-        if full_page:
-            # Try to size to full page height (cap to a sane max)
+    def _checkout(self, timeout: float):
+        deadline = time.monotonic() + timeout
+        while True:
             try:
-                height = local_driver.execute_script(
-                    "return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight, "
-                    "document.body.offsetHeight, document.documentElement.offsetHeight, "
-                    "document.body.clientHeight, document.documentElement.clientHeight);"
-                )
-                height = int(max(1080, min(height or 1080, 20000)))
-                local_driver.set_window_size(1920, height)
-                time.sleep(0.2)
-            except Exception:
+                return self._idle.get_nowait()
+            except queue.Empty:
                 pass
+            with self._lock:
+                spawn = self._created < self._size
+                if spawn:
+                    self._created += 1
+            if spawn:
+                try:
+                    return _create_headless_driver(self._profile)
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError("Timed out waiting for a free headless browser")
+            # Short waits: a retired driver frees a slot without putting anything on the queue
+            try:
+                return self._idle.get(timeout=min(remaining, 0.5))
+            except queue.Empty:
+                continue
 
-        # Ensure PNG path
-        out_path = out_path.with_suffix(".png")
-        local_driver.save_screenshot(str(out_path))
-    finally:
-        if own_driver:
+    def release(self, driver):
+        """Reset the driver and return it to the pool (or retire it once worn out)."""
+        uses = self._uses.get(id(driver), 0) + 1
+        if uses >= self._max_uses:
+            self._retire(driver)
+            return
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            driver.set_window_size(1920, 1080)
+        except Exception:
+            self._retire(driver)
+            return
+        self._uses[id(driver)] = uses
+        self._idle.put_nowait(driver)
+
+    def _retire(self, driver):
+        self._uses.pop(id(driver), None)
+        _quit_driver(driver)
+        with self._lock:
+            self._created -= 1
+
+    def close(self):
+        while True:
             try:
-                local_driver.quit()
-            except Exception:
-                pass
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._retire(driver)
+
+_driver_pools = {}
+_driver_pools_lock = threading.Lock()
+
+def _driver_pool(profile: str = DEFAULT_BROWSER_PROFILE) -> _WebDriverPool:
+    if profile not in BROWSER_PROFILES:
+        profile = DEFAULT_BROWSER_PROFILE
+    with _driver_pools_lock:
+        pool = _driver_pools.get(profile)
+        if pool is None:
+            pool = _driver_pools[profile] = _WebDriverPool(profile)
+        return pool
+
+def _close_driver_pools():
+    for pool in list(_driver_pools.values()):
+        pool.close()
+
+atexit.register(_close_driver_pools)
+
+# Resolves once the DOM is parsed and the main thread goes idle (bounded so busy pages can't stall us)
+_WAIT_FOR_IDLE_JS = """
+const done = arguments[arguments.length - 1];
+const idle = () => window.requestIdleCallback
+    ? window.requestIdleCallback(() => done(true), {timeout: 2000})
+    : setTimeout(() => done(true), 100);
+if (document.readyState === 'loading') {
+  document.addEventListener('DOMContentLoaded', idle, {once: true});
+} else {
+  idle();
+}
+"""
+
+# CDP Runtime.evaluate expression: wait for readiness + idle + a painted frame, then return
+# [page height, viewport width, viewport height]. Called as `(...)(eager)`; every wait is bounded.
+_SETTLE_AND_MEASURE_JS = """
+(async (eager) => {
+  const sleep = (ms) => new Promise(r => setTimeout(r, ms));
+  const ready = () => document.readyState === 'complete' || (eager && document.readyState === 'interactive');
+  if (!ready()) {
+    await Promise.race([sleep(5000), new Promise(r => {
+      const check = () => { if (ready()) { document.removeEventListener('readystatechange', check); r(); } };
+      document.addEventListener('readystatechange', check);
+    })]);
+  }
+  await Promise.race([sleep(2000), new Promise(r => window.requestIdleCallback
+      ? window.requestIdleCallback(r, {timeout: 2000}) : setTimeout(r, 100))]);
+  await Promise.race([sleep(500), new Promise(r => requestAnimationFrame(() => r()))]);
+  const d = document.documentElement, b = document.body || d;
+  return [Math.max(b.scrollHeight, d.scrollHeight, b.offsetHeight, d.offsetHeight, b.clientHeight, d.clientHeight),
+          d.clientWidth, d.clientHeight];
+})
+"""
+
+def _is_eager(driver) -> bool:
+    try:
+        return (driver.capabilities or {}).get("pageLoadStrategy") == "eager"
+    except Exception:
+        return False
+
+def _wait_until_ready(driver):
+    """WebDriver-protocol fallback for the readiness wait (used when CDP isn't available)."""
+    # Eager drivers only need the DOM, so don't hold them up waiting for subresources.
+    try:
+        ready_states = ("interactive", "complete") if _is_eager(driver) else ("complete",)
+        WebDriverWait(driver, 5, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") in ready_states
+        )
+    except TimeoutException:
+        pass
+    except Exception:
+        time.sleep(1.0)
+    try:
+        driver.execute_async_script(_WAIT_FOR_IDLE_JS)
+    except Exception:
+        pass
+
+def _cdp_full_page_png(driver) -> bytes:
+    """Settle, measure and capture the full page in two CDP calls (no window resize / relayout)."""
+    res = driver.execute_cdp_cmd("Runtime.evaluate", {
+        "expression": f"{_SETTLE_AND_MEASURE_JS}({'true' if _is_eager(driver) else 'false'})",
+        "awaitPromise": True,
+        "returnByValue": True,
+    })
+    if res.get("exceptionDetails"):
+        raise RuntimeError(f"Page measurement failed: {res['exceptionDetails'].get('text', '')}")
+    page_height, view_width, view_height = res["result"]["value"]
+    width = int(view_width or 1920)
+    height = int(max(view_height or 1080, min(page_height or 1080, 20000)))
+    shot = driver.execute_cdp_cmd("Page.captureScreenshot", {
+        "format": "png",
+        "captureBeyondViewport": True,
+        "clip": {"x": 0, "y": 0, "width": width, "height": height, "scale": 1},
+    })
+    return base64.b64decode(shot["data"])
+
+def screenshot_website(url: str, out_path: Path = None, driver=None, full_page=True):
+    """Take a screenshot of a website using a headless browser (pooled if no driver is given).
+
+    Writes a PNG to `out_path`, or returns the PNG bytes when no path is given.
+    """
+    if driver is None:
+        with _driver_pool().acquire() as pooled:
+            return screenshot_website(url, out_path, driver=pooled, full_page=full_page)
+
+    driver.get(url)
+
+    png = None
+    if full_page:
+        try:
+            png = _cdp_full_page_png(driver)
+        except Exception:
+            pass  # no CDP (non-Chromium driver): fall back to WebDriver waits + window resize
+
+    if png is None:
+        _wait_until_ready(driver)
+
+    if full_page and png is None:
+        # Try to size to full page height (cap to a sane max)
+        try:
+            height = driver.execute_script(
+                "return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight, "
+                "document.body.offsetHeight, document.documentElement.offsetHeight, "
+                "document.body.clientHeight, document.documentElement.clientHeight);"
+            )
+            height = int(max(1080, min(height or 1080, 20000)))
+            driver.set_window_size(1920, height)
+            time.sleep(0.2)
+        except Exception:
+            pass
+
+    if png is None:
+        png = driver.get_screenshot_as_png()
+    if out_path is None:
+        return png
+    # Ensure PNG path
+    out_path.with_suffix(".png").write_bytes(png)
+    return None
 
 # ----------------- Poller Thread -----------------
 
-def _poller_loop(url: str, interval: float, doc_path: Path):
+def _driver_rss_bytes(driver) -> int:
+    """Resident memory of chromedriver and its Chrome children (0 if unknown)."""
+    if psutil is None:
+        return 0
+    try:
+        proc = psutil.Process(driver.service.process.pid)
+        return sum(p.memory_info().rss for p in [proc] + proc.children(recursive=True))
+    except Exception:
+        return 0
+
+def _respawn_driver(driver_ref: list, profile: str):
+    if driver_ref[0] is not None:
+        _quit_driver(driver_ref[0])
+        driver_ref[0] = None
+    driver_ref[0] = _create_headless_driver(profile)
+
+def _session_alive(driver) -> bool:
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+def _capture_once(driver_ref: list, url: str, profile: str) -> bytes:
+    """PNG of `url` via driver_ref[0]; if the browser session died, respawn it and retry once.
+
+    Page problems (timeouts, DNS/network errors) are raised as-is: Chrome is fine, and a
+    restart would only repeat the same wait.
+    """
+    if driver_ref[0] is None:
+        driver_ref[0] = _create_headless_driver(profile)
+    try:
+        return screenshot_website(url, driver=driver_ref[0], full_page=True)
+    except TimeoutException:
+        raise
+    except (InvalidSessionIdException, NoSuchWindowException):
+        pass
+    except WebDriverException:
+        if _session_alive(driver_ref[0]):
+            raise
+    _respawn_driver(driver_ref, profile)
+    return screenshot_website(url, driver=driver_ref[0], full_page=True)
+
+def _poller_loop(url: str, interval: float, doc_path: Path, profile: str = DEFAULT_BROWSER_PROFILE):
     """Background loop: screenshot URL every `interval` seconds and append to doc."""
     global _poller_status
     try:
-        driver = _create_headless_driver()
+        driver_ref = [_create_headless_driver(profile)]
     except Exception as e:
-        _poller_status = {"running": False, "url": "", "interval": 0.0, "last_error": str(e), "last_saved": ""}
+        _poller_status = {"running": False, "url": "", "interval": 0.0, "profile": profile,
+                          "last_error": str(e), "last_saved": ""}
         return
 
+    # Long enough that a batch can actually fill at this interval, but bounded so a crash
+    # can't cost more than POLLER_BATCH_MAX_AGE_SECONDS of captures
+    batch_age = min(POLLER_BATCH_MAX_AGE_SECONDS, max(BATCH_MAX_AGE_SECONDS, interval * BATCH_MAX_ENTRIES))
+    capture_count = 0
+    unreported = []  # batch Futures of captures whose save outcome isn't shown yet
+    last_saved = ""
+    save_error = ""  # sticks until a later save succeeds
     try:
         while not _poller_stop.is_set():
-            tmp_png = doc_path.parent / f"auto_{int(time.time()*1000)}.png"
-            last_saved = ""
-            last_error = ""
+            capture_error = ""
             try:
-                screenshot_website(url, tmp_png, driver=driver, full_page=True)
+                png = _capture_once(driver_ref, url, profile)
+                capture_count += 1
                 ctx = f"Auto capture of {url}"
-                last_saved = str(append_entry(doc_path, ctx, tmp_png))
+                unreported.append(append_entry_batched(doc_path, ctx, png, max_age=batch_age))
             except Exception as e:
-                last_error = str(e)
-            finally:
-                try:
-                    if tmp_png.exists():
-                        tmp_png.unlink()
-                except Exception:
-                    pass
+                capture_error = str(e)
+
+            # Report saves that have landed (or failed) since the previous round
+            still_pending = []
+            for saved in unreported:
+                if not saved.done():
+                    still_pending.append(saved)
+                elif saved.exception() is not None:
+                    save_error = f"Batched save failed: {saved.exception()}"
+                else:
+                    last_saved = str(saved.result())
+                    save_error = ""
+            unreported = still_pending
 
             _poller_status = {
                 "running": not _poller_stop.is_set(),
                 "url": url,
                 "interval": interval,
-                "last_error": last_error,
-                "last_saved": last_saved,
-                "last_capture": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "profile": profile,
+                "last_error": capture_error or save_error,
+                "last_saved": last_saved or ("queued for the next batched save" if unreported else ""),
+                "pending_saves": len(unreported),
+                "last_capture": _timestamp(),
             }
 
             if _poller_stop.is_set():
@@ -280,15 +1044,25 @@ def _poller_loop(url: str, interval: float, doc_path: Path):
             if interval <= 0:
                 break
 
-            end_time = time.time() + interval
-            while time.time() < end_time and not _poller_stop.is_set():
-                time.sleep(0.25)
+            # Chrome grows over long sessions; restart it proactively
+            if driver_ref[0] is not None and (
+                capture_count >= POLLER_RECYCLE_EVERY or _driver_rss_bytes(driver_ref[0]) > POLLER_MAX_DRIVER_RSS
+            ):
+                capture_count = 0
+                try:
+                    _respawn_driver(driver_ref, profile)
+                except Exception as e:
+                    _poller_status["last_error"] = str(e)
+
+            # Sleep until the next interval, waking immediately if stop is requested
+            if _poller_stop.wait(timeout=max(0.0, interval)):
+                break
     finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
-        _poller_status = {"running": False, "url": "", "interval": 0.0, "last_error": "", "last_saved": ""}
+        _flush_batch_quietly()
+        if driver_ref[0] is not None:
+            _quit_driver(driver_ref[0])
+        _poller_status = {"running": False, "url": "", "interval": 0.0, "profile": profile,
+                          "last_error": "", "last_saved": ""}
 
 # ----------------- UI -----------------
 
@@ -300,46 +1074,8 @@ HTML = """
   <meta charset="utf-8">
   <title>{{ title }}</title>
   <meta name="viewport" content="width=device-width, initial-scale=1">
-  <style>
-    body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-           background: #0b0b0c; color: #e7e7ea; display:flex; min-height:100vh; align-items:center; justify-content:center; }
-    .wrap { width: 900px; max-width: 96vw; display:flex; flex-direction:column; gap:20px; }
-    .card { background: #17171a; border-radius: 20px; box-shadow: 0 10px 30px rgba(0,0,0,0.4);
-            padding: 24px; }
-    h1 { margin: 0 0 6px 0; font-size: 28px; }
-    p.sub { margin: 0 0 18px 0; opacity: 0.8; }
-    textarea, input[type=number], input[type=text], input[type=url] {
-      box-sizing: border-box;
-      width: 100%; background: #0f0f12; color: #e7e7ea; border: 1px solid #2a2a2e;
-      border-radius: 12px; padding: 12px; font-size: 16px; outline: none;
-    }
-    textarea { height: 120px; }
-    .grid { display:grid; grid-template-columns: minmax(0, 1fr) 220px; gap: 12px; align-items:center; }
-    .actions { display:flex; gap:12px; margin-top: 16px; align-items:center; flex-wrap:wrap; }
-    .btn { display:inline-block; padding: 16px 24px; font-size: 22px; font-weight: 800; border:none; cursor:pointer;
-           border-radius: 16px; transition: transform 0.05s ease; }
-    .btn:active { transform: translateY(2px); }
-    .btn-red { background:#c1121f; color:white; }
-    .btn-green { background:#2d6a4f; color:white; }
-    .btn-gray { background:#343a40; color:white; }
-    .hint { opacity:0.7; font-size: 13px; }
-    .flash { margin-top: 12px; padding: 10px 12px; border-radius: 10px; background: #12351f; color: #c7f7d1; }
-    label { font-size: 14px; opacity: 0.9; }
-    .status { margin-top: 8px; font-size: 14px; opacity: 0.85; }
-  
-    @media (max-width: 880px) {
-      .grid { grid-template-columns: 1fr; }
-    }
-  </style>
-  <script>
-    function onManualCapture() {
-      const btn = document.getElementById('captureBtn');
-      const delay = document.getElementById('delay').value || '0';
-      btn.disabled = true;
-      btn.innerText = "Capture in " + delay + "s…";
-      document.getElementById('manualForm').submit();
-    }
-  </script>
+  <link rel="stylesheet" href="{{ url_for('static', filename='app.css') }}">
+  <script src="{{ url_for('static', filename='app.js') }}"></script>
 </head>
 <body>
   <div class="wrap">
@@ -354,6 +1090,11 @@ HTML = """
           {% endfor %}
         {% endif %}
       {% endwith %}
+      {% if job_id %}
+        <div class="flash" id="jobStatus" data-job-url="{{ url_for('job_status', job_id=job_id) }}">
+          📸 Capture scheduled (delay {{ delay }}s)…
+        </div>
+      {% endif %}
     </div>
 
     <div class="card">
@@ -367,6 +1108,13 @@ HTML = """
           <div>
             <label for="delay">Delay before capture (seconds)</label>
             <input id="delay" name="delay" type="number" step="0.1" min="0" max="60" value="{{ delay }}">
+            <label for="monitor">Screen</label>
+            <select id="monitor" name="monitor">
+              <option value="0" {% if monitor == 0 %}selected{% endif %}>All monitors</option>
+              {% for idx in monitor_choices %}
+                <option value="{{ idx }}" {% if monitor == idx %}selected{% endif %}>Monitor {{ idx }}{% if idx == 1 %} (primary){% endif %}</option>
+              {% endfor %}
+            </select>
           </div>
         </div>
         <div class="actions">
@@ -388,13 +1136,21 @@ HTML = """
             <label for="poll_interval">Interval seconds</label>
             <input id="poll_interval" name="poll_interval" type="number" step="1" min="5" max="86400" value="{{ poll_interval or 60 }}">
           </div>
+          <div>
+            <label for="poll_profile">Page load</label>
+            <select id="poll_profile" name="profile">
+              {% for key, prof in browser_profiles.items() %}
+                <option value="{{ key }}" {% if key == poll_profile %}selected{% endif %}>{{ prof.label }}</option>
+              {% endfor %}
+            </select>
+          </div>
         </div>
         <div class="actions">
           <button class="btn btn-green" type="submit">START POLLER</button>
           <a class="btn btn-gray" href="{{ url_for('poll_stop') }}">STOP POLLER</a>
           <span class="status">
             {% if poll_status.running %}
-              ✅ Running every {{ poll_status.interval }}s on {{ poll_status.url }}<br/>
+              ✅ Running every {{ poll_status.interval }}s on {{ poll_status.url }} ({{ poll_status.profile }})<br/>
               🔄 Last capture: {{ poll_status.last_capture or "n/a" }}<br/>
               💾 Last saved: {{ poll_status.last_saved or "n/a" }}<br/>
               ⚠️ Last error: {{ poll_status.last_error or "none" }}
@@ -428,19 +1184,71 @@ HTML = """
 </html>
 """
 
+# Compiled once; Flask's jinja_env supplies url_for/get_flashed_messages at render time
+_TEMPLATE = app.jinja_env.from_string(HTML)
+
+def _monitor_arg(values) -> int:
+    try:
+        return max(0, int(values.get("monitor", DEFAULT_MONITOR_INDEX)))
+    except Exception:
+        return DEFAULT_MONITOR_INDEX
+
 @app.get("/")
 def index():
     try:
         delay = float(request.args.get("delay", DEFAULT_DELAY_SECONDS))
     except Exception:
         delay = DEFAULT_DELAY_SECONDS
-    return render_template_string(HTML, title=APP_TITLE, doc_path=str(user_documents_dir() / DEFAULT_DOC_NAME),
+    monitor_count = max(2, len(desktop_monitors()))  # always offer at least "Monitor 1"
+    return _TEMPLATE.render(title=APP_TITLE, doc_path=str(user_documents_dir() / DEFAULT_DOC_NAME),
         delay=delay,
         poll_status=_poller_status,
         poll_url=_poller_status.get("url", ""),
         poll_interval=int(_poller_status.get("interval", 60) or 60),
+        poll_profile=_poller_status.get("profile", DEFAULT_BROWSER_PROFILE),
+        browser_profiles=BROWSER_PROFILES,
+        job_id=request.args.get("job", ""),
+        monitor=_monitor_arg(request.args),
+        monitor_choices=range(1, monitor_count),
     )
 
+def _do_capture(context: str, delay: float, doc_path: Path, monitor_index: int = DEFAULT_MONITOR_INDEX):
+    """Capture-pool worker: wait out the delay, grab the desktop, queue the row.
+
+    Returns the batch Future for the row, so a burst of clicks shares one doc save.
+    """
+    if delay > 0:
+        # Use the wait: load the log doc meanwhile so the save doesn't have to parse it.
+        # Not joined: the grab must happen when the delay ends, even if a save holds
+        # _doc_lock; the write re-checks the cache and opens (and reports) the doc itself.
+        _warm_pool.submit(_warm_document, doc_path)
+        time.sleep(delay)
+    shot = grab_desktop_image(monitor_index)
+    return append_entry_batched(doc_path, context, shot, manual=True)
+
+def _job_outcome(future):
+    """(done, saved_to, error) for a capture job; a job's result is the batch Future of its row."""
+    if not future.done():
+        return False, "", ""
+    try:
+        saved = future.result()
+        if isinstance(saved, concurrent.futures.Future):
+            if not saved.done():
+                return False, "", ""
+            saved = saved.result()
+        return True, str(saved), ""
+    except Exception as e:
+        return True, "", str(e)
+
+def _track_job(future, delay: float) -> str:
+    job_id = uuid.uuid4().hex[:12]
+    with _jobs_lock:
+        _jobs[job_id] = (future, delay)
+        if len(_jobs) > MAX_TRACKED_JOBS:
+            for old_id in [jid for jid, (fut, _) in _jobs.items() if fut.done()][:len(_jobs) - MAX_TRACKED_JOBS]:
+                del _jobs[old_id]
+    return job_id
+
 @app.post("/capture")
 def capture():
     try:
@@ -449,29 +1257,43 @@ def capture():
         delay = DEFAULT_DELAY_SECONDS
     delay = max(0.0, min(60.0, delay))
 
+    monitor = _monitor_arg(request.form)
     context = request.form.get("context", "").strip()
     out_dir = user_documents_dir()
     out_dir.mkdir(parents=True, exist_ok=True)
     doc_path = out_dir / DEFAULT_DOC_NAME
 
-    if delay > 0:
-        time.sleep(delay)
+    future = _capture_pool.submit(_do_capture, context, delay, doc_path, monitor)
+    job_id = _track_job(future, delay)
+    return redirect(url_for('index', delay=f"{delay:.1f}", monitor=monitor, job=job_id))
 
-    tmp_png = out_dir / f"context_shot_{int(time.time()*1000)}.png"
-    try:
-        take_full_screenshot_to(tmp_png)
-        saved_to = append_entry(doc_path, context, tmp_png)
-        flash(f"Saved to {saved_to} (delay={delay:.1f}s)")
-    except Exception as e:
-        flash(f"Error: {e}")
-    finally:
-        try:
-            if tmp_png.exists():
-                tmp_png.unlink()
-        except Exception:
-            pass
+@app.get("/job/<job_id>")
+def job_status(job_id):
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    if job is None:
+        return jsonify({"id": job_id, "done": True, "error": "Unknown capture job"}), 404
+    future, delay = job
+    done, saved_to, error = _job_outcome(future)
+    return jsonify({"id": job_id, "done": done, "delay": f"{delay:.1f}", "saved_to": saved_to, "error": error})
 
-    return redirect(url_for('index', delay=f"{delay:.1f}"))
+@app.get("/status")
+def status():
+    """Writer backlog: captures still waiting/grabbing and rows queued for the next doc save."""
+    with _jobs_lock:
+        capturing = sum(1 for fut, _ in _jobs.values() if not fut.done())
+    # Unlocked snapshots (GIL-atomic reads): _doc_lock is held for whole saves and parses,
+    # which is exactly when this endpoint gets asked
+    pending_rows = len(_pending_batch)
+    timer, deadline = _batch_timer, _batch_deadline
+    next_save_in = max(0.0, deadline - time.monotonic()) if timer is not None else None
+    return jsonify({
+        "capturing": capturing,
+        "pending_rows": pending_rows,
+        "next_save_in": next_save_in,
+        "last_save_error": _last_batch_error,
+        "poller": _poller_status,
+    })
 
 @app.post("/poll/start")
 def poll_start():
@@ -482,6 +1304,10 @@ def poll_start():
     except Exception:
         interval = 60.0
     interval = max(5.0, min(86400.0, interval))
+    # Browser profile may come from the form or the query string (?profile=normal)
+    profile = (request.values.get("profile") or DEFAULT_BROWSER_PROFILE).strip().lower()
+    if profile not in BROWSER_PROFILES:
+        profile = DEFAULT_BROWSER_PROFILE
 
     if not url.lower().startswith(("http://", "https://")):
         flash("Please provide a valid URL starting with http:// or https://")
@@ -496,10 +1322,10 @@ def poll_start():
     doc_path = out_dir / DEFAULT_DOC_NAME
 
     _poller_stop.clear()
-    _poller_status = {"running": True, "url": url, "interval": interval}
-    _poller_thread = threading.Thread(target=_poller_loop, args=(url, interval, doc_path), daemon=True)
+    _poller_status = {"running": True, "url": url, "interval": interval, "profile": profile}
+    _poller_thread = threading.Thread(target=_poller_loop, args=(url, interval, doc_path, profile), daemon=True)
     _poller_thread.start()
-    flash(f"Poller started: every {interval:.0f}s on {url}")
+    flash(f"Poller started: every {interval:.0f}s on {url} ({BROWSER_PROFILES[profile]['label']})")
     return redirect(url_for('index'))
 
 @app.get("/poll/stop")
@@ -509,7 +1335,7 @@ def poll_stop():
         _poller_stop.set()
         th = _poller_thread
         _poller_thread = None
-        _poller_status = {"running": False, "url": "", "interval": 0.0}
+        _poller_status = {"running": False, "url": "", "interval": 0.0, "profile": _poller_status.get("profile", DEFAULT_BROWSER_PROFILE)}
         if th is not None:
             th.join(timeout=5.0)
         flash("Poller stopped.")
@@ -536,25 +1362,22 @@ def poll_test():
     out_dir = user_documents_dir()
     out_dir.mkdir(parents=True, exist_ok=True)
     doc_path = out_dir / DEFAULT_DOC_NAME
-    tmp_png = out_dir / f"test_{int(time.time()*1000)}.png"
     try:
-        screenshot_website(url, tmp_png, driver=None, full_page=True)
-        saved_to = append_entry(doc_path, f"Manual website capture of {url}", tmp_png)
+        with _driver_pool().acquire() as driver:
+            png = screenshot_website(url, driver=driver, full_page=True)
+        saved_to = append_entry(doc_path, f"Manual website capture of {url}", png)
         flash(f"Captured and saved to {saved_to}")
     except Exception as e:
         flash(f"Error during test capture: {e}")
-    finally:
-        try:
-            if tmp_png.exists():
-                tmp_png.unlink()
-        except Exception:
-            pass
     return redirect(url_for('index'))
 
 def main():
     url = f"http://{HOST}:{PORT}"
     webbrowser.open(url, new=2)
-    app.run(host=HOST, port=PORT, debug=False)
+    if serve is not None:
+        serve(app, host=HOST, port=PORT, threads=4)
+    else:
+        app.run(host=HOST, port=PORT, debug=False, threaded=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,7 +2,7 @@
 """
 Big Red Button — Cross-Platform Web Edition (Windows-friendly)
 --------------------------------------------------------------
-- Windows/Linux: uses MSS to capture the full virtual screen.
+- Windows/Linux: uses MSS to capture the primary monitor (or another screen / all of them).
 - macOS: uses `screencapture` (native, no extra permissions beyond Screen Recording).
 
 Workflow:
@@ -12,67 +12,113 @@ The Word file: ~/Documents/ContextShots.docx
 Two columns per row: [Context + timestamp] | [Screenshot]
 Rotates after 90 rows (ContextShots (2).docx, etc.).
 """
+import io
 import os
 import time
+import functools
 import shlex
+import tempfile
 import platform
 import subprocess
-from datetime import datetime
 from pathlib import Path
 import webbrowser
 
-from flask import Flask, request, render_template_string, redirect, url_for, flash
+from flask import Flask, request, redirect, url_for, flash
 
 # Word
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
 
 # Screenshot (Windows/Linux)
 from mss import mss
 from mss.tools import to_png
 
+# Optional: downscale screenshots to the column before embedding (full resolution without it)
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Optional: threaded production WSGI server (falls back to Flask's dev server)
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
 APP_TITLE = "Big Red Button - Context + Screenshot (Cross-Platform)"
 HOST = "127.0.0.1"
 PORT = 8788
 MAX_ROWS_PER_DOC = 90
 DEFAULT_DOC_NAME = "ContextShots.docx"
 DEFAULT_DELAY_SECONDS = 2.0
+DOC_COLUMN_WIDTH_INCHES = 3.1  # each of the two table columns
+DOC_IMAGE_DPI = 300           # embedded screenshots are sized for this print density in the column
+DOC_IMAGE_MAX_SIZE = (int(DOC_COLUMN_WIDTH_INCHES * DOC_IMAGE_DPI), 6000)  # px bounding box (~930 wide)
+DEFAULT_MONITOR_INDEX = 1     # MSS numbering: 0 = all monitors (virtual desktop), 1 = primary, 2.. = others
 
 app = Flask(__name__)
 app.secret_key = "context-shot-cross"
 
+_monitor_list = None  # sct.monitors, looked up once per process
+# Log base path -> number of its newest "(n)" rollover part (1 = the base file itself)
+_doc_parts = {}
+
+@functools.lru_cache(maxsize=1)
 def user_documents_dir() -> Path:
     home = Path.home()
     docs = home / "Documents"
     return docs if docs.exists() else home
 
-def next_available_filename(base: Path) -> Path:
+def _part_name(base: Path, n: int) -> Path:
+    return base if n < 2 else base.with_name(f"{base.stem} ({n}){base.suffix}")
+
+def latest_document_part(base: Path) -> Path:
+    """Newest rollover file of `base` (`base` itself until it has rolled over).
+
+    The part number is remembered, so normally this costs one stat; the "(2), (3), ..."
+    candidates are only probed again if that part disappears.
+    """
+    n = _doc_parts.get(str(base))
+    if n is None or not _part_name(base, n).exists():
+        if not base.exists():
+            _doc_parts.pop(str(base), None)
+            return base
+        n = 1
+        while _part_name(base, n + 1).exists():
+            n += 1
+        _doc_parts[str(base)] = n
+    return _part_name(base, n)
+
+def _next_part_number(base: Path) -> int:
+    """Part number for the next new log file (1 = `base` itself, when it doesn't exist)."""
     if not base.exists():
-        return base
-    stem, suffix = base.stem, base.suffix
-    n = 2
-    while True:
-        cand = base.with_name(f"{stem} ({n}){suffix}")
-        if not cand.exists():
-            return cand
+        return 1
+    latest_document_part(base)  # refreshes _doc_parts
+    n = _doc_parts[str(base)] + 1
+    while _part_name(base, n).exists():  # parts created behind our back (e.g. another instance)
         n += 1
+    return n
+
+def next_available_filename(base: Path) -> Path:
+    return _part_name(base, _next_part_number(base))
 
 def _set_table_column_widths(table, widths_in_inches):
-    for idx, width in enumerate(widths_in_inches):
-        for cell in table.columns[idx].cells:
-            tc = cell._tc
-            tcPr = tc.get_or_add_tcPr()
-            tcW = OxmlElement('w:tcW')
-            tcW.set(qn('w:type'), 'dxa')
-            tcW.set(qn('w:w'), str(int(width * 1440)))
-            tcPr.append(tcW)
+    """Set widths on the table grid (w:gridCol); rows added later copy their cell widths from it."""
+    widths = [Inches(w) for w in widths_in_inches]
+    for grid_col, width in zip(table._tbl.tblGrid.gridCol_lst, widths):
+        grid_col.w = width
+    # Cells that already exist (just the header row at creation time) carry their own w:tcW
+    for row in table.rows:
+        for cell, width in zip(row.cells, widths):
+            cell.width = width
+
+def _log_title(title_suffix: str = "") -> str:
+    return f"Context + Screenshot Log {title_suffix}".strip()
 
 def _add_title_and_table(doc: Document, title_suffix: str = ""):
     title = doc.add_paragraph()
-    run = title.add_run(f"Context + Screenshot Log {title_suffix}".strip())
+    run = title.add_run(_log_title(title_suffix))
     run.font.size = Pt(16)
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
@@ -80,31 +126,58 @@ def _add_title_and_table(doc: Document, title_suffix: str = ""):
     hdr = table.rows[0].cells
     hdr[0].text = "Context (with timestamp)"
     hdr[1].text = "Screenshot"
-    _set_table_column_widths(table, [3.1, 3.1])
+    _set_table_column_widths(table, [DOC_COLUMN_WIDTH_INCHES, DOC_COLUMN_WIDTH_INCHES])
+    return table
+
+@functools.lru_cache(maxsize=1)
+def _empty_log_doc_bytes() -> bytes:
+    """A saved blank log (title + header table), built once so new/rotated docs skip the default template."""
+    doc = Document()
+    _add_title_and_table(doc)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+def _new_log_document(title_suffix: str = ""):
+    """Fresh log doc from the cached blank; returns (doc, table)."""
+    doc = Document(io.BytesIO(_empty_log_doc_bytes()))
+    if title_suffix:
+        for para in doc.paragraphs:
+            if para.runs and para.runs[0].text == _log_title():
+                para.runs[0].text = _log_title(title_suffix)
+                break
+    return doc, doc.tables[0]
+
+def _rotated_document(base: Path):
+    n = _next_part_number(base)
+    _doc_parts[str(base)] = n
+    # n == 1: the base file was moved away, so the log starts over under its own name
+    doc, table = _new_log_document(title_suffix=f"(Part {n})" if n > 1 else "")
+    return doc, table, _part_name(base, n)
 
-def ensure_document_and_table(doc_path: Path):
+def ensure_document_and_table(base: Path):
+    """Open (or create/rotate) the log doc. Returns (doc, table, path).
+
+    Rows go to the newest rollover part of `base`; a new part starts once that one is full.
+    """
+    doc_path = latest_document_part(base)
     if doc_path.exists():
         doc = Document(str(doc_path))
-        if doc.tables:
-            table = doc.tables[0]
+        tables = doc.tables  # an XPath walk over the body each time it's read
+        if tables:
+            table = tables[0]
             if len(table.columns) != 2:
-                doc = Document()
-                _add_title_and_table(doc)
-                return doc, doc.tables[0], doc_path
+                doc, table = _new_log_document()
+                return doc, table, doc_path
             rows = max(0, len(table.rows) - 1)
             if rows >= MAX_ROWS_PER_DOC:
-                new_path = next_available_filename(doc_path)
-                doc = Document()
-                _add_title_and_table(doc, title_suffix=f"(Part {new_path.stem.split()[-1].strip('()')})")
-                return doc, doc.tables[0], new_path
+                return _rotated_document(base)
             return doc, table, doc_path
         else:
-            _add_title_and_table(doc)
-            return doc, doc.tables[0], doc_path
+            return doc, _add_title_and_table(doc), doc_path
     else:
-        doc = Document()
-        _add_title_and_table(doc)
-        return doc, doc.tables[0], doc_path
+        doc, table = _new_log_document()
+        return doc, table, doc_path
 
 def compute_column_image_width_inches(doc: Document) -> float:
     section = doc.sections[0]
@@ -114,35 +187,102 @@ def compute_column_image_width_inches(doc: Document) -> float:
     usable = page_width - left - right
     return max(2.2, min((usable / 2.0) - 0.15, 3.5))
 
-def take_full_screenshot_to(file_path: Path) -> None:
+def desktop_monitors() -> list:
+    """MSS monitor geometry: [virtual desktop, monitor 1, monitor 2, ...] ([] if unavailable)."""
+    global _monitor_list
+    if _monitor_list is None:
+        try:
+            with mss() as sct:
+                _monitor_list = list(sct.monitors)
+        except Exception:
+            return []
+    return _monitor_list
+
+def _valid_monitor_index(monitor_index: int) -> int:
+    count = len(desktop_monitors())
+    if count == 0 or 0 <= monitor_index < count:
+        return monitor_index
+    return 1 if count > 1 else 0
+
+def take_full_screenshot_to(file_path: Path = None, monitor_index: int = DEFAULT_MONITOR_INDEX):
+    """Screen capture as PNG: written to `file_path`, or returned as bytes when no path is given.
+
+    `monitor_index` follows MSS numbering: 0 is the whole virtual desktop, 1 the primary monitor.
+    """
     system = platform.system().lower()
     if system == "darwin":
-        cmd = f'screencapture -x -t png {shlex.quote(str(file_path))}'
+        if file_path is None:
+            # screencapture only writes files; read it back and clean up
+            fd, tmp = tempfile.mkstemp(suffix=".png")
+            os.close(fd)
+            tmp_png = Path(tmp)
+            try:
+                take_full_screenshot_to(tmp_png, monitor_index=monitor_index)
+                return tmp_png.read_bytes()
+            finally:
+                try:
+                    tmp_png.unlink()
+                except OSError:
+                    pass
+        display = f"-D {int(monitor_index)} " if monitor_index >= 1 else ""
+        cmd = f'screencapture -x {display}-t png {shlex.quote(str(file_path))}'
         subprocess.run(cmd, shell=True, check=True)
-        return
+        return None
+    with mss() as sct:
+        monitors = desktop_monitors() or sct.monitors
+        raw = sct.grab(monitors[_valid_monitor_index(monitor_index)])
+        # fast zlib; screenshots barely grow
+        png = to_png(raw.rgb, raw.size, level=1, output=None if file_path is None else str(file_path))
+    return png
+
+def _encode_png(img) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+def grab_for_doc(monitor_index: int = DEFAULT_MONITOR_INDEX) -> bytes:
+    """PNG bytes of a screen, downscaled to DOC_IMAGE_MAX_SIZE when Pillow is installed."""
+    if Image is None:
+        return take_full_screenshot_to(monitor_index=monitor_index)
+    if platform.system().lower() == "darwin":
+        png = take_full_screenshot_to(monitor_index=monitor_index)
+        with Image.open(io.BytesIO(png)) as img:
+            if img.width <= DOC_IMAGE_MAX_SIZE[0] and img.height <= DOC_IMAGE_MAX_SIZE[1]:
+                return png
+            img.thumbnail(DOC_IMAGE_MAX_SIZE, Image.BILINEAR)
+            return _encode_png(img)
     with mss() as sct:
-        monitor = sct.monitors[0]
-        raw = sct.grab(monitor)
-        to_png(raw.rgb, raw.size, output=str(file_path))
-
-def append_entry(doc_path: Path, context_text: str, screenshot_path: Path) -> Path:
-    target = doc_path
-    if target.exists():
-        doc_tmp = Document(str(target))
-        table_tmp = doc_tmp.tables[0] if doc_tmp.tables else None
-        rows_tmp = (len(table_tmp.rows) - 1) if table_tmp else 0
-        if rows_tmp >= MAX_ROWS_PER_DOC:
-            target = next_available_filename(target)
-
-    doc, table, target = ensure_document_and_table(target)
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        monitors = desktop_monitors() or sct.monitors
+        raw = sct.grab(monitors[_valid_monitor_index(monitor_index)])
+        # Pillow decodes MSS's BGRA buffer straight to RGB (no extra raw.rgb copy)
+        img = Image.frombuffer("RGB", raw.size, raw.raw, "raw", "BGRX", 0, 1)
+    img.thumbnail(DOC_IMAGE_MAX_SIZE, Image.BILINEAR)
+    return _encode_png(img)
+
+def _timestamp(t: float = None) -> str:
+    """Local "YYYY-mm-dd HH:MM:SS" for epoch seconds `t` (default: now), via C strftime."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+
+def append_entry(doc_path: Path, context_text: str, screenshot, captured_at: float = None) -> Path:
+    """Append one row; `screenshot` is PNG bytes (kept in memory) or a PNG path."""
+    # ensure_document_and_table handles rotation, so the doc is parsed only once
+    doc, table, target = ensure_document_and_table(doc_path)
+    ts = _timestamp(captured_at)
     row = table.add_row()
     row.cells[0].text = f"{ts} — {context_text.strip() if context_text else '(no context provided)'}"
     p = row.cells[1].paragraphs[0]
     run = p.add_run()
     width = compute_column_image_width_inches(doc)
-    run.add_picture(str(screenshot_path), width=Inches(width))
-    doc.save(str(target))
+    source = io.BytesIO(screenshot) if isinstance(screenshot, (bytes, bytearray)) else str(screenshot)
+    run.add_picture(source, width=Inches(width))
+    # Save beside the log and swap it in, so a crash mid-save never leaves a half-written docx
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        doc.save(str(tmp))
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
     return target
 
 HTML = """
@@ -159,7 +299,7 @@ HTML = """
             padding: 24px; }
     h1 { margin: 0 0 6px 0; font-size: 28px; }
     p.sub { margin: 0 0 18px 0; opacity: 0.8; }
-    textarea, input[type=number] { width: 100%; background: #0f0f12; color: #e7e7ea; border: 1px solid #2a2a2e;
+    textarea, select, input[type=number] { width: 100%; background: #0f0f12; color: #e7e7ea; border: 1px solid #2a2a2e;
                border-radius: 12px; padding: 12px; font-size: 16px; outline: none; }
     textarea { height: 120px; }
     .grid { display:grid; grid-template-columns: 1fr 160px; gap: 12px; align-items:center; }
@@ -171,6 +311,7 @@ HTML = """
     .hint { opacity:0.7; font-size: 13px; }
     .flash { margin-top: 12px; padding: 10px 12px; border-radius: 10px; background: #12351f; color: #c7f7d1; }
     label { font-size: 14px; opacity: 0.9; }
+    .grid input + label { display:block; margin-top: 10px; }
   </style>
   <script>
     function onCaptureClick() {
@@ -202,6 +343,13 @@ HTML = """
         <div>
           <label for="delay">Delay before capture (seconds)</label>
           <input id="delay" name="delay" type="number" step="0.1" min="0" max="60" value="{{ delay }}">
+          <label for="monitor">Screen</label>
+          <select id="monitor" name="monitor">
+            <option value="0" {% if monitor == 0 %}selected{% endif %}>All monitors</option>
+            {% for idx in monitor_choices %}
+              <option value="{{ idx }}" {% if monitor == idx %}selected{% endif %}>Monitor {{ idx }}{% if idx == 1 %} (primary){% endif %}</option>
+            {% endfor %}
+          </select>
         </div>
       </div>
       <div class="actions">
@@ -214,13 +362,24 @@ HTML = """
 </html>
 """
 
+# Compiled once; Flask's jinja_env supplies url_for/get_flashed_messages at render time
+_TEMPLATE = app.jinja_env.from_string(HTML)
+
+def _monitor_arg(values) -> int:
+    try:
+        return max(0, int(values.get("monitor", DEFAULT_MONITOR_INDEX)))
+    except Exception:
+        return DEFAULT_MONITOR_INDEX
+
 @app.get("/")
 def index():
     try:
         delay = float(request.args.get("delay", DEFAULT_DELAY_SECONDS))
     except Exception:
         delay = DEFAULT_DELAY_SECONDS
-    return render_template_string(HTML, title=APP_TITLE, delay=delay)
+    monitor_count = max(2, len(desktop_monitors()))  # always offer at least "Monitor 1"
+    return _TEMPLATE.render(title=APP_TITLE, delay=delay, monitor=_monitor_arg(request.args),
+                            monitor_choices=range(1, monitor_count))
 
 @app.post("/capture")
 def capture():
@@ -230,6 +389,7 @@ def capture():
         delay = DEFAULT_DELAY_SECONDS
     delay = max(0.0, min(60.0, delay))
 
+    monitor = _monitor_arg(request.form)
     context = request.form.get("context", "").strip()
     out_dir = user_documents_dir()
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -238,26 +398,23 @@ def capture():
     if delay > 0:
         time.sleep(delay)
 
-    tmp_png = out_dir / f"context_shot_{int(time.time()*1000)}.png"
+    captured_at = time.time()
     try:
-        take_full_screenshot_to(tmp_png)
-        saved_to = append_entry(doc_path, context, tmp_png)
+        png = grab_for_doc(monitor)  # in memory; no temp PNG next to the log
+        saved_to = append_entry(doc_path, context, png, captured_at=captured_at)
         flash(f"Saved to {saved_to} (delay={delay:.1f}s)")
     except Exception as e:
         flash(f"Error: {e}")
-    finally:
-        try:
-            if tmp_png.exists():
-                tmp_png.unlink()
-        except Exception:
-            pass
 
-    return redirect(url_for('index', delay=f"{delay:.1f}"))
+    return redirect(url_for('index', delay=f"{delay:.1f}", monitor=monitor))
 
 def main():
     url = f"http://{HOST}:{PORT}"
     webbrowser.open(url, new=2)
-    app.run(host=HOST, port=PORT, debug=False)
+    if serve is not None:
+        serve(app, host=HOST, port=PORT, threads=4)
+    else:
+        app.run(host=HOST, port=PORT, debug=False, threaded=True)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,24 @@
+function onManualCapture() {
+  const btn = document.getElementById('captureBtn');
+  const delay = document.getElementById('delay').value || '0';
+  btn.disabled = true;
+  btn.innerText = "Capture in " + delay + "s…";
+  document.getElementById('manualForm').submit();
+}
+
+function pollCaptureJob() {
+  const el = document.getElementById('jobStatus');
+  if (!el) return;
+  fetch(el.dataset.jobUrl)
+    .then(r => r.json())
+    .then(job => {
+      if (!job.done) {
+        setTimeout(pollCaptureJob, 500);
+        return;
+      }
+      el.innerText = job.error ? "Error: " + job.error : "Saved to " + job.saved_to + " (delay=" + job.delay + "s)";
+    })
+    .catch(() => setTimeout(pollCaptureJob, 2000));
+}
+
+document.addEventListener('DOMContentLoaded', pollCaptureJob);